@@ -2,8 +2,92 @@
 Pytest configuration and fixtures
 """
 
+import json
 import sys
 from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+import pytest_asyncio
+
+from app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared by all tests"""
+    # Only the client stack is imported lazily; the app itself is always loaded
+    from fastapi.testclient import TestClient
+
+    client = TestClient(app)
+    # Send one request up front so first-request warm-up is paid by this
+    # session fixture rather than showing up in whichever test runs first
+    client.get("/activities")
+    return client
+
+
+@pytest_asyncio.fixture
+async def aclient():
+    """Create an async client that calls the app in the test's event loop"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def asgi_get():
+    """Return a coroutine that sends a GET straight to the app's ASGI callable
+
+    Unlike TestClient this needs no portal thread: the request runs in the
+    caller's event loop. The URL may include a query string. It returns the
+    status code and the raw body.
+    """
+
+    async def get(url):
+        parts = urlsplit(url)
+        path = unquote(parts.path)
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": quote(path).encode(),
+            "query_string": parts.query.encode(),
+            "root_path": "",
+            "headers": [(b"host", b"test")],
+            "server": ("test", 80),
+            "client": ("testclient", 50000),
+        }
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        await app(scope, receive, send)
+        status = messages[0]["status"]
+        body = b"".join(m.get("body", b"") for m in messages[1:])
+        return status, body
+
+    return get
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def activities_json(asgi_get):
+    """Fetch GET /activities once per session for read-only tests
+
+    Only tests that don't mutate activities (or that restore it via
+    reset_activities) should rely on this decoded snapshot.
+    """
+    status, body = await asgi_get("/activities")
+    assert status == 200
+    return json.loads(body)
@@ -3,101 +3,90 @@ Tests for the Mergington High School Activities API
 """
 
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import activities, app, root, signup_for_activity, unregister_from_activity
 
-from app import app
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# Activities exercised by the parametrized signup/unregister tests
+ACTIVITY_NAMES = ["Basketball Team", "Tennis Club"]
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities before each test"""
-    from app import activities
-    
-    # Store original state
-    original_state = {
-        k: {"participants": v["participants"].copy(), **{kk: vv for kk, vv in v.items() if kk != "participants"}}
-        for k, v in activities.items()
+    """Reset activities before each test
+
+    The activities dict is module state, so under pytest-xdist each worker
+    process has its own copy and this reset only needs to be per-test.
+    """
+    # Store original participants (the only field the endpoints mutate)
+    original_participants = {
+        name: list(data["participants"]) for name, data in activities.items()
     }
-    
+
     yield
-    
-    # Restore original state
-    for activity_name, activity_data in activities.items():
-        activity_data["participants"] = original_state[activity_name]["participants"]
+
+    # Restore participants in place, skipping lists that were not touched
+    for name, participants in original_participants.items():
+        current = activities[name]["participants"]
+        if current != participants:
+            current[:] = participants
+
+
+def returns_all_activities(data):
+    """GET /activities returns all available activities"""
+    assert isinstance(data, dict)
+    assert {"Basketball Team", "Tennis Club", "Debate Team"} <= data.keys()
+
+
+def has_required_fields(data):
+    """Activities have required fields"""
+    required = {"description", "schedule", "max_participants", "participants"}
+    assert all(required <= activity_data.keys() for activity_data in data.values())
+
+
+def participants_is_list(data):
+    """Participants is a list"""
+    for activity_name, activity_data in data.items():
+        assert isinstance(activity_data["participants"], list)
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
-        """Test that GET /activities returns all available activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
-        assert isinstance(data, dict)
-        assert "Basketball Team" in data
-        assert "Tennis Club" in data
-        assert "Debate Team" in data
-    
-    def test_get_activities_has_required_fields(self, client):
-        """Test that activities have required fields"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-    
-    def test_get_activities_participants_is_list(self, client):
-        """Test that participants is a list"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        for activity_name, activity_data in data.items():
-            assert isinstance(activity_data["participants"], list)
+    @pytest.mark.parametrize(
+        "check",
+        [returns_all_activities, has_required_fields, participants_is_list],
+        ids=lambda check: check.__name__,
+    )
+    def test_get_activities_contract(self, activities_json, check):
+        """Test the GET /activities response, fetched once for all checks"""
+        check(activities_json)
 
 
 class TestSignup:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_valid_student(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", ACTIVITY_NAMES)
+    def test_signup_valid_student(self, client, reset_activities, activity):
         """Test successful signup for a student"""
         response = client.post(
-            "/activities/Basketball Team/signup?email=newstudent@mergington.edu"
+            f"/activities/{activity}/signup", params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "newstudent@mergington.edu" in data["message"]
     
-    def test_signup_adds_participant(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", ACTIVITY_NAMES)
+    def test_signup_adds_participant(self, reset_activities, activity):
         """Test that signup actually adds the participant"""
-        # Get initial count
-        response_before = client.get("/activities")
-        before_count = len(response_before.json()["Basketball Team"]["participants"])
-        
-        # Signup new student
-        client.post("/activities/Basketball Team/signup?email=newstudent@mergington.edu")
+        participants = activities[activity]["participants"]
+        before_count = len(participants)
         
-        # Get updated count
-        response_after = client.get("/activities")
-        after_count = len(response_after.json()["Basketball Team"]["participants"])
+        # Call the endpoint function directly; the HTTP path is covered above
+        signup_for_activity(activity, "newstudent@mergington.edu")
         
-        assert after_count == before_count + 1
-        assert "newstudent@mergington.edu" in response_after.json()["Basketball Team"]["participants"]
+        assert len(participants) == before_count + 1
+        assert "newstudent@mergington.edu" in participants
     
     def test_signup_invalid_activity(self, client):
         """Test signup for non-existent activity"""
@@ -108,14 +97,17 @@ class TestSignup:
         data = response.json()
         assert "Activity not found" in data["detail"]
     
-    def test_signup_duplicate_student(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", ACTIVITY_NAMES)
+    def test_signup_duplicate_student(self, client, reset_activities, activity):
         """Test that a student cannot sign up twice for the same activity"""
         # First signup
-        client.post("/activities/Basketball Team/signup?email=duplicate@mergington.edu")
+        client.post(
+            f"/activities/{activity}/signup", params={"email": "duplicate@mergington.edu"}
+        )
         
         # Attempt duplicate signup
         response = client.post(
-            "/activities/Basketball Team/signup?email=duplicate@mergington.edu"
+            f"/activities/{activity}/signup", params={"email": "duplicate@mergington.edu"}
         )
         assert response.status_code == 400
         data = response.json()
@@ -134,40 +126,37 @@ class TestSignup:
 class TestUnregister:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_valid_participant(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", ACTIVITY_NAMES)
+    def test_unregister_valid_participant(self, client, reset_activities, activity):
         """Test successful unregistration of a participant"""
         # First add a participant
-        client.post("/activities/Basketball Team/signup?email=teststudent@mergington.edu")
+        client.post(
+            f"/activities/{activity}/signup", params={"email": "teststudent@mergington.edu"}
+        )
         
         # Then unregister them
         response = client.delete(
-            "/activities/Basketball Team/unregister?email=teststudent@mergington.edu"
+            f"/activities/{activity}/unregister", params={"email": "teststudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
         assert "Unregistered" in data["message"]
         assert "teststudent@mergington.edu" in data["message"]
     
-    def test_unregister_removes_participant(self, client, reset_activities):
+    @pytest.mark.parametrize("activity", ACTIVITY_NAMES)
+    def test_unregister_removes_participant(self, reset_activities, activity):
         """Test that unregister actually removes the participant"""
-        # Add a participant
-        client.post("/activities/Basketball Team/signup?email=teststudent@mergington.edu")
-        
-        # Get count before unregister
-        response_before = client.get("/activities")
-        before_count = len(response_before.json()["Basketball Team"]["participants"])
+        participants = activities[activity]["participants"]
         
-        # Unregister
-        client.delete(
-            "/activities/Basketball Team/unregister?email=teststudent@mergington.edu"
-        )
+        # Add a participant
+        signup_for_activity(activity, "teststudent@mergington.edu")
+        before_count = len(participants)
         
-        # Get count after unregister
-        response_after = client.get("/activities")
-        after_count = len(response_after.json()["Basketball Team"]["participants"])
+        # Unregister, calling the endpoint function directly
+        unregister_from_activity(activity, "teststudent@mergington.edu")
         
-        assert after_count == before_count - 1
-        assert "teststudent@mergington.edu" not in response_after.json()["Basketball Team"]["participants"]
+        assert len(participants) == before_count - 1
+        assert "teststudent@mergington.edu" not in participants
     
     def test_unregister_invalid_activity(self, client):
         """Test unregister for non-existent activity"""
@@ -195,16 +184,21 @@ class TestUnregister:
         assert response.status_code == 200
         
         # Verify they're removed
-        response_after = client.get("/activities")
-        assert "james@mergington.edu" not in response_after.json()["Basketball Team"]["participants"]
+        assert "james@mergington.edu" not in activities["Basketball Team"]["participants"]
 
 
 class TestRoot:
     """Tests for GET / endpoint"""
     
-    def test_root_redirects(self, client):
+    def test_root_route_registered(self):
+        """Test that GET / is routed to the root endpoint"""
+        route = next(r for r in app.routes if r.path == "/")
+        assert route.endpoint is root
+        assert "GET" in route.methods
+    
+    def test_root_redirects(self):
         """Test that root redirects to static page"""
-        response = client.get("/", follow_redirects=False)
+        response = root()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -212,42 +206,37 @@ class TestRoot:
 class TestEdgeCases:
     """Tests for edge cases and integration scenarios"""
     
-    def test_signup_and_unregister_cycle(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_and_unregister_cycle(self, aclient, reset_activities):
         """Test the complete signup and unregister cycle"""
         email = "cycle@mergington.edu"
         
         # Sign up
-        response1 = client.post(
-            f"/activities/Tennis Club/signup?email={email}"
+        response1 = await aclient.post(
+            "/activities/Tennis Club/signup", params={"email": email}
         )
         assert response1.status_code == 200
         
         # Verify signed up
-        response2 = client.get("/activities")
-        assert email in response2.json()["Tennis Club"]["participants"]
+        assert email in activities["Tennis Club"]["participants"]
         
         # Unregister
-        response3 = client.delete(
-            f"/activities/Tennis Club/unregister?email={email}"
+        response2 = await aclient.delete(
+            "/activities/Tennis Club/unregister", params={"email": email}
         )
-        assert response3.status_code == 200
+        assert response2.status_code == 200
         
         # Verify unregistered
-        response4 = client.get("/activities")
-        assert email not in response4.json()["Tennis Club"]["participants"]
+        assert email not in activities["Tennis Club"]["participants"]
     
-    def test_multiple_activities_signup(self, client, reset_activities):
+    def test_multiple_activities_signup(self, reset_activities):
         """Test that a student can sign up for multiple activities"""
         email = "multi@mergington.edu"
         
         # Sign up for multiple activities
-        response1 = client.post(f"/activities/Basketball Team/signup?email={email}")
-        assert response1.status_code == 200
-        
-        response2 = client.post(f"/activities/Tennis Club/signup?email={email}")
-        assert response2.status_code == 200
+        signup_for_activity("Basketball Team", email)
+        signup_for_activity("Tennis Club", email)
         
         # Verify in both activities
-        response = client.get("/activities")
-        assert email in response.json()["Basketball Team"]["participants"]
-        assert email in response.json()["Tennis Club"]["participants"]
+        assert email in activities["Basketball Team"]["participants"]
+        assert email in activities["Tennis Club"]["participants"]